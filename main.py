@@ -5,36 +5,67 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from matplotlib.figure import Figure
 import matplotlib
-from datetime import datetime
+import os
+import sys
+import select
 import time
 import serial
 import serial.tools.list_ports
 import re
 import threading
-import queue
+from collections import deque
+
+# 使用matplotlib的fast样式（路径简化、分块渲染），加快实时绘制
+matplotlib.style.use('fast')
 
 # 配置matplotlib支持中文显示
 matplotlib.rcParams['font.sans-serif'] = ['Microsoft YaHei']
 matplotlib.rcParams['axes.unicode_minus'] = False
 
-# 配置日志
+# 配置日志（默认不输出 DEBUG，串口热路径中的调试日志在格式化之前即被跳过，
+# 需要调试时改为 logging.DEBUG）
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
 class DataGloveVisualizer:
+    # 角度数据包 C1=115.412,C2=34.382,... 中的数值部分
+    _PACKET_RE = re.compile(rb'=(-?\d+\.?\d*)')
+
+    # 单行串口数据的最大长度（14路角度约150字节），防止设备异常时无限读取
+    _MAX_LINE = 256
+
+    # POSIX 下一次 os.read 最多读取的字节数，足够一次取完串口缓冲区中积压的数据
+    _READ_SIZE = 4096
+
+    # 数据队列的最大长度，界面线程来不及处理时内存不会无限增长
+    _QUEUE_MAXLEN = 1024
+
+    # 每个指关节对应的角度通道（行：大拇指、食指、中指、无名指、小指）
+    # 大拇指只有两个关节，第三列不使用
+    _ANGLE_CHANNELS = np.array([
+        [0, 0, 0],      # 大拇指 (C1,C1)
+        [3, 2, 5],      # 食指 (C4,C3,C6)
+        [6, 9, 4],      # 中指 (C7,C10,C5)
+        [13, 8, 7],     # 无名指 (C14,C9,C8)
+        [12, 11, 10],   # 小指 (C13,C12,C11)
+    ])
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("数据手套可视化系统")
         self.root.geometry("1200x800")
         
-        # 初始化数据队列
-        self.data_queue = queue.Queue()
+        # 初始化数据队列：串口线程 append，界面线程 popleft（单生产者单消费者，
+        # CPython 中 deque 的这两个操作是原子的，无需加锁）；
+        # 界面卡顿时自动丢弃最旧的数据，反正每种数据只显示最新一帧
+        self.data_queue = deque(maxlen=self._QUEUE_MAXLEN)
         self.serial_thread = None
-        self.thread_running = False
+        self._stop = threading.Event()  # 通知串口线程退出
         self.visualization_running = False
         
         # 初始化串口
@@ -43,8 +74,8 @@ class DataGloveVisualizer:
         self.available_ports = []  # 存储可用串口列表
         
         # 添加校准数据存储
-        self.calibration_min = [float('inf')] * 14
-        self.calibration_max = [float('-inf')] * 14
+        self.calibration_min = np.full(14, np.inf, dtype=np.float32)
+        self.calibration_max = np.full(14, -np.inf, dtype=np.float32)
         self.is_calibrated = False
         
         # 初始化视角参数
@@ -52,6 +83,11 @@ class DataGloveVisualizer:
         self.view_azim = 45
         self.update_interval = 17  # 默认60FPS (1000ms/60 ≈ 16.67ms)
         
+        # 数据面板刷新间隔，数值显示无需与3D模型同频刷新
+        self._data_display_interval_ms = 100  # 最高10Hz
+        self._last_data_display_ts = 0
+        self._data_display_pending = False
+        
         # 初始化颜色方案
         self.finger_colors = {
             'finger_0': '#FF99CC',  # 大拇指
@@ -61,14 +97,28 @@ class DataGloveVisualizer:
             'finger_4': '#FFFF99'   # 小指
         }
         
+        # 预先计算基础颜色的RGB值，避免每帧解析颜色字符串
+        self._finger_base_rgb = np.array(
+            [matplotlib.colors.to_rgb(self.finger_colors[f'finger_{i}']) for i in range(5)],
+            dtype=np.float32)  # (5, 3)
+        self._highlight_rgb = np.array([1, 0, 0], dtype=np.float32)  # 红色
+        
         # 初始化角度和压力数据
-        self.angle_data = {}
-        self.angle_data["finger_1"] = [30, 40, 50]  # 食指
-        self.angle_data["finger_2"] = [35, 45, 55]  # 中指
-        self.angle_data["finger_3"] = [40, 50, 60]  # 无名指
-        self.angle_data["finger_4"] = [45, 55, 65]  # 小指
-        self.angle_data["finger_0"] = [180]*2  # 大拇指只有两个值
-        self.pressure_data = [0]*5
+        # 角度数据：每行一根手指（0为大拇指），大拇指只有两个值，第三个为 NaN
+        self.angle_data = np.array([
+            [180, 180, np.nan],  # 大拇指
+            [30, 40, 50],        # 食指
+            [35, 45, 55],        # 中指
+            [40, 50, 60],        # 无名指
+            [45, 55, 65]         # 小指
+        ], dtype=np.float32)
+        self.pressure_data = np.zeros(5, dtype=np.int16)  # 压力数据（0为大拇指，ADC读数用int16即可）
+        
+        # 串口消息类型 -> 界面线程中的处理函数
+        self._data_handlers = {
+            'angle': self._apply_angles,
+            'pressure': self._apply_pressure
+        }
         
         # 创建主分割窗口
         self.main_frame = ttk.Frame(self.root)
@@ -80,6 +130,11 @@ class DataGloveVisualizer:
         
         # 添加更新锁定变量
         self.updating = False
+        self._render_pending = False
+        self._update_job = None         # 已安排但尚未执行的更新
+        self._last_update_ts = 0        # 上次更新的时间(ms)
+        self._data_event = threading.Event()  # 串口线程有新数据、界面线程尚未处理
+        self._poll_job = None           # 检查新数据标志的定时器，只在串口线程运行时存在
         
         # 添加控制按钮
         self.init_control_panel()
@@ -105,149 +160,89 @@ class DataGloveVisualizer:
         
         logging.info("应用程序初始化完成")
 
+    def _compute_joint_positions(self, angles):
+        """批量计算所有手指的关节位置（正向运动学）
+        
+        angles 为 (5, 3) 的关节角度数组，大拇指第三个关节为 NaN。
+        返回形状为 (5, 4, 3) 的数组：5根手指 × (起始点 + 3个关节) × xyz，
+        大拇指的第三个关节同样为 NaN。
+        结果写入预分配的缓冲区 self._buf_joints，每帧复用，不分配新数组。
+        """
+        # 累积角度（相对于上一个关节）
+        cumulative = self._buf_cum
+        np.deg2rad(angles, out=cumulative)
+        np.cumsum(cumulative, axis=1, out=cumulative)
+        cumulative += self._fk_base_angle[:, None]
+        
+        # 每个骨节的位移向量，大拇指额外向x负方向偏移
+        steps = self._buf_steps
+        np.cos(cumulative, out=self._buf_trig)
+        np.multiply(self._fk_lengths, self._buf_trig, out=steps[..., 1])
+        np.multiply(self._fk_lateral[:, None], steps[..., 1], out=steps[..., 0])
+        np.sin(cumulative, out=self._buf_trig)
+        np.multiply(self._fk_lengths, self._buf_trig, out=steps[..., 2])
+        
+        positions = self._buf_joints
+        positions[:, 0] = self._fk_base
+        np.cumsum(steps, axis=1, out=positions[:, 1:])
+        positions[:, 1:] += self._fk_base[:, None, :]
+        return positions
+
     def create_hand_model(self, angles=None, pressures=None):
-        """使用 Matplotlib 创建手部模型"""
+        """使用 Matplotlib 更新手部模型（只更新已创建图元的数据）"""
         if angles is None:
             angles = self.angle_data
         if pressures is None:
             pressures = self.pressure_data
         
         # 确保压力数据有效
-        if not isinstance(pressures, list) or len(pressures) != 5:
-            pressures = [0] * 5
-        
-        # 确保压力值在0-1024范围内
-        pressures = [min(max(p, 0), 1024) for p in pressures]
-        
-        # 清除当前图形
-        self.ax.cla()
-        
-        # 更新视图范围
-        self.update_view_limits()
-        
-        # 手掌参数
-        palm_width = 0.3
-        palm_height = 0.4
-        
-        # 绘制手掌轮廓
-        palm_points = np.array([
-            [-palm_width/2, 0, 0],  # 左下
-            [palm_width/2, 0, 0],   # 右下
-            [palm_width/2, palm_height, 0],  # 右上
-            [-palm_width/2, palm_height, 0]  # 左上
-        ])
-        
-        # 绘制手掌
-        self.ax.plot(palm_points[[0,1,2,3,0], 0], 
-                    palm_points[[0,1,2,3,0], 1], 
-                    palm_points[[0,1,2,3,0], 2], 
-                    color='gray', alpha=0.5)
-        
-        # 手指基础参数
-        finger_positions = [
-            (-0.12, palm_height, 0),    # 食指
-            (-0.04, palm_height, 0),    # 中指
-            (0.04, palm_height, 0),     # 无名指
-            (0.12, palm_height, 0)      # 小指
-        ]
-        
-        # 绘制手指
-        for i, (x, y, z) in enumerate(finger_positions):
-            finger_key = f'finger_{i+1}'
-            finger_angles = angles[finger_key]
-            finger_color = self.finger_colors[finger_key]
-            
-            # 获取压力值并确保正确归一化
-            pressure = pressures[i+1] / 1024.0  # 确保使用正确的索引
-            pressure = min(max(pressure, 0), 1)  # 确保在0-1范围内
-            
-            base_color = np.array(matplotlib.colors.to_rgb(finger_color))
-            highlight_color = np.array([1, 0, 0])  # 红色
-            color = tuple(base_color * (1-pressure) + highlight_color * pressure)
-            
-            # 计算累积角度和位置
-            current_x, current_y, current_z = x, y, z
-            cumulative_angle = 0  # 累积角度
-            joint_lengths = [0.12, 0.10, 0.08]  # 关节长度
-            
-            # 绘制起始关节
-            self.ax.scatter([current_x], [current_y], [current_z], 
-                          c=[color], s=60, alpha=0.8)
-            
-            # 绘制每个关节
-            for j, (angle, length) in enumerate(zip(finger_angles, joint_lengths)):
-                # 累积角度（相对于上一个关节）
-                cumulative_angle += angle
-                
-                # 计算新的位置
-                radians = np.deg2rad(cumulative_angle)
-                next_x = current_x
-                next_y = current_y + length * np.cos(radians)
-                next_z = current_z + length * np.sin(radians)
-                
-                # 绘制骨节
-                self.ax.plot([current_x, next_x], 
-                           [current_y, next_y], 
-                           [current_z, next_z],
-                           color=color, 
-                           linewidth=3*(1-j*0.2),
-                           alpha=0.8)
-                
-                # 绘制关节球体
-                joint_size = 60 * (1-(j+1)*0.2)
-                self.ax.scatter([next_x], [next_y], [next_z], 
-                              c=[color], s=joint_size, alpha=0.8)
-                
-                # 更新当前位置
-                current_x, current_y, current_z = next_x, next_y, next_z
-        
-        # 特殊处理大拇指
-        thumb_pos = (-palm_width/2 - 0.02, palm_height*0.3, 0)
-        thumb_angles = angles['finger_0']
-        thumb_color = self.finger_colors['finger_0']
-        
-        # 获取大拇指压力值并计算颜色
-        thumb_pressure = min(max(pressures[0] / 1024.0, 0), 1)  # 归一化压力值
-        base_color = np.array(matplotlib.colors.to_rgb(thumb_color))
-        highlight_color = np.array([1, 0, 0])  # 红色
-        thumb_color = tuple(base_color * (1-thumb_pressure) + highlight_color * thumb_pressure)
-        
-        current_x, current_y, current_z = thumb_pos
-        cumulative_angle = -30  # 大拇指基础角度
-        
-        # 绘制大拇指起始关节
-        self.ax.scatter([current_x], [current_y], [current_z], 
-                      c=[thumb_color], s=60, alpha=0.8)
-        
-        # 大拇指关节
-        joint_lengths = [0.12, 0.10]
-        for j, (angle, length) in enumerate(zip(thumb_angles, joint_lengths)):
-            # 累积角度
-            cumulative_angle += angle
-            
-            # 计算新位置
-            radians = np.deg2rad(cumulative_angle)
-            next_x = current_x - length * np.cos(radians) * 0.5
-            next_y = current_y + length * np.cos(radians)
-            next_z = current_z + length * np.sin(radians)
-            
-            # 绘制骨节
-            self.ax.plot([current_x, next_x], 
-                       [current_y, next_y], 
-                       [current_z, next_z],
-                       color=thumb_color, 
-                       linewidth=3*(1-j*0.2),
-                       alpha=0.8)
-            
-            # 绘制关节球体
-            joint_size = 60 * (1-j*0.2)
-            self.ax.scatter([next_x], [next_y], [next_z], 
-                          c=[thumb_color], s=joint_size, alpha=0.8)
-            
-            current_x, current_y, current_z = next_x, next_y, next_z
-        
-        # 更新画布
-        self.canvas.draw()
+        if np.shape(pressures) != (5,):
+            pressures = self._zero_pressure
+        
+        # 压力值归一化到0-1范围，按压力从基础颜色渐变到红色
+        p = self._buf_pressure
+        np.divide(pressures, 1024.0, out=p[:, 0])
+        np.clip(p, 0, 1, out=p)
+        colors = self._buf_colors
+        np.subtract(self._highlight_rgb, self._finger_base_rgb, out=colors)
+        colors *= p
+        colors += self._finger_base_rgb
+        
+        # 计算关节位置
+        positions = self._compute_joint_positions(angles)
+        
+        # 更新骨节：每根手指相邻两个关节构成一段骨节，去掉大拇指不存在的第三段
+        self._buf_segments[:, :, 0] = positions[:, :-1]
+        self._buf_segments[:, :, 1] = positions[:, 1:]
+        np.compress(self._bone_mask, self._buf_segments.reshape(-1, 2, 3), axis=0,
+                    out=self._buf_bones)
+        self.bones.set_segments(self._buf_bones)
+        np.take(colors, self._bone_finger, axis=0, out=self._buf_bone_colors)
+        self.bones.set_color(self._buf_bone_colors)
+        
+        # 更新关节散点（坐标是 self._buf_joints 的视图，已随缓冲区更新）
+        self.joint_scatter._offsets3d = self._joint_xyz
+        np.take(colors, self._joint_finger, axis=0, out=self._buf_joint_colors)
+        self.joint_scatter.set_facecolors(self._buf_joint_colors)
+        
+        # 更新画布：只有手部数据变化，恢复缓存的背景后重绘手部图元
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_hand_artists()
+        self.canvas.blit(self.fig.bbox)
+
+    def _draw_hand_artists(self):
+        """先画骨节再画关节，关节点盖在骨节端点上（与完整重绘的顺序一致）"""
+        for artist in (self.bones, self.joint_scatter):
+            artist.do_3d_projection()  # draw_artist 不会自动做3D投影
+            self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """完整重绘后缓存不含手部图元的背景，再绘制手部图元"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_hand_artists()
 
     def init_3d_view(self):
         """初始化3D视图"""
@@ -263,22 +258,85 @@ class DataGloveVisualizer:
         # 设置固定的显示范围
         self.update_view_limits()
         
-        # # 设置标签
-        # self.ax.set_xlabel('X轴')
-        # self.ax.set_ylabel('Y轴')
-        # self.ax.set_zlabel('Z轴')
-        
-        # # 添加标题
-        # self.ax.set_title('手部模型可视化')
-        
         # 优化显示效果
         self.ax.grid(False)
         self.ax.xaxis.pane.fill = False
         self.ax.yaxis.pane.fill = False
         self.ax.zaxis.pane.fill = False
         
+        # 默认隐藏坐标轴（刻度、标签、面板），减少每次重绘的文字排版
+        if not self.show_axes_var.get():
+            self.ax.set_axis_off()
+        
+        # 手掌参数
+        self.palm_width = 0.3
+        self.palm_height = 0.4
+        
+        # 绘制手掌轮廓（静态，只绘制一次）
+        palm_points = np.array([
+            [-self.palm_width/2, 0, 0],  # 左下
+            [self.palm_width/2, 0, 0],   # 右下
+            [self.palm_width/2, self.palm_height, 0],  # 右上
+            [-self.palm_width/2, self.palm_height, 0]  # 左上
+        ])
+        self.palm_line, = self.ax.plot(palm_points[[0,1,2,3,0], 0], 
+                                       palm_points[[0,1,2,3,0], 1], 
+                                       palm_points[[0,1,2,3,0], 2], 
+                                       color='gray', alpha=0.5)
+        
+        # 手部正向运动学参数：第0行为大拇指，1-4行为食指到小指
+        self._fk_lengths = np.array([[0.12, 0.10, 0.08]] * 5)  # 关节长度
+        self._fk_base = np.array([
+            (-self.palm_width/2 - 0.02, self.palm_height*0.3, 0),  # 大拇指
+            (-0.12, self.palm_height, 0),    # 食指
+            (-0.04, self.palm_height, 0),    # 中指
+            (0.04, self.palm_height, 0),     # 无名指
+            (0.12, self.palm_height, 0)      # 小指
+        ])
+        self._fk_base_angle = np.deg2rad([-30, 0, 0, 0, 0])  # 大拇指基础角度
+        self._fk_lateral = np.array([-0.5, 0, 0, 0, 0])  # 大拇指沿x方向的偏移系数
+        
+        # 关节球体大小：起始关节最大，越靠近指尖越小
+        self._joint_sizes = np.array([
+            [60, 60, 48, 0],  # 大拇指
+            *[[60, 48, 36, 24]] * 4
+        ], dtype=float).ravel()
+        
+        # 骨节粗细：越靠近指尖越细
+        self._bone_mask = ~np.isnan(self.angle_data).ravel()
+        bone_widths = np.tile([3, 2.4, 1.8], 5)[self._bone_mask]
+        
+        # 每段骨节、每个关节所属的手指，用于从手指颜色展开
+        self._bone_finger = np.repeat(np.arange(5), 3)[self._bone_mask]
+        self._joint_finger = np.repeat(np.arange(5), 4)
+        
+        # 预分配每帧复用的缓冲区
+        self._buf_cum = np.empty((5, 3))
+        self._buf_trig = np.empty((5, 3))
+        self._buf_steps = np.empty((5, 3, 3))
+        self._buf_joints = np.empty((5, 4, 3))
+        self._buf_segments = np.empty((5, 3, 2, 3))
+        self._buf_bones = np.empty((len(bone_widths), 2, 3))
+        self._buf_pressure = np.empty((5, 1), dtype=np.float32)
+        self._zero_pressure = np.zeros(5, dtype=np.int16)
+        self._buf_colors = np.empty((5, 3), dtype=np.float32)
+        self._buf_bone_colors = np.empty((len(bone_widths), 3), dtype=np.float32)
+        self._buf_joint_colors = np.empty((20, 3), dtype=np.float32)
+        joints = self._buf_joints.reshape(-1, 3)
+        self._joint_xyz = (joints[:, 0], joints[:, 1], joints[:, 2])
+        
+        # 创建持久的图元（所有骨节一个集合，所有关节一个散点集合），每帧只更新数据
+        # 手部图元设为 animated，不参与完整重绘，数据更新时通过 blit 单独绘制
+        self.bones = Line3DCollection(np.zeros((len(bone_widths), 2, 3)),
+                                      linewidths=bone_widths, alpha=0.8, animated=True)
+        self.ax.add_collection3d(self.bones)
+        self.joint_scatter = self.ax.scatter(*np.zeros((3, len(self._joint_sizes))),
+                                             s=self._joint_sizes, alpha=0.8, animated=True)
+        
         # 在Tkinter中嵌入Matplotlib图形
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame_3d)
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -301,6 +359,8 @@ class DataGloveVisualizer:
         self.last_x = 0
         self.last_y = 0
         self.is_rotating = False
+        self._last_mouse_draw_ts = 0
+        self._mouse_draw_interval = 1 / 30  # 拖动旋转时最多30Hz重绘
 
         def on_mouse_press(event):
             if event.inaxes == self.ax:
@@ -309,6 +369,9 @@ class DataGloveVisualizer:
                 self.last_y = event.ydata
 
         def on_mouse_release(event):
+            if self.is_rotating:
+                # 确保最后一次旋转的视角被绘制
+                self.canvas.draw_idle()
             self.is_rotating = False
 
         def on_mouse_move(event):
@@ -321,7 +384,10 @@ class DataGloveVisualizer:
                 self.view_elev = np.clip(self.view_elev + dy * 150, -90, 90)
                 
                 self.ax.view_init(self.view_elev, self.view_azim)
-                self.canvas.draw()
+                now = time.monotonic()
+                if now - self._last_mouse_draw_ts > self._mouse_draw_interval:
+                    self.canvas.draw_idle()
+                    self._last_mouse_draw_ts = now
                 
                 self.last_x = event.xdata
                 self.last_y = event.ydata
@@ -335,7 +401,7 @@ class DataGloveVisualizer:
             
             # 更新视图范围
             self.update_view_limits()
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
         # 绑定鼠标事件
         self.canvas.mpl_connect('button_press_event', on_mouse_press)
@@ -345,130 +411,53 @@ class DataGloveVisualizer:
 
     def update_hand_model(self, angles=None, pressures=None):
         """更新手部模型"""
-        # logging.debug(f"update_hand_model called with angles={angles}, pressures={pressures}")
-        # logging.debug(f"current self.angle_data={self.angle_data}")
-        # logging.debug(f"current self.pressure_data={self.pressure_data}")
         if angles is None:
             angles = self.angle_data
         if pressures is None:
             pressures = self.pressure_data
         
-        # 保存当前视角
-        current_elev = self.ax.elev
-        current_azim = self.ax.azim
-        
-        # # 清除当前图形内容，但保留坐标轴
-        # self.ax.clear()
-        
-        # # 重新设置视图属性
-        # self.update_view_limits()
-        # self.ax.grid(False)
-        # self.ax.xaxis.pane.fill = False
-        # self.ax.yaxis.pane.fill = False
-        # self.ax.zaxis.pane.fill = False
-        # self.ax.set_xlabel('X轴')
-        # self.ax.set_ylabel('Y轴')
-        # self.ax.set_zlabel('Z轴')
-        # self.ax.set_title('手部模型可视化')
-
-        # 更新模型
-        self.create_hand_model(angles, pressures)
-        
-        # 恢复之前的视角
-        self.ax.view_init(elev=current_elev, azim=current_azim)
-        
-        # 创建新的手部模型
-        # self.update_hand_model_parts(angles, pressures)
+        # 更新模型（坐标轴不再清除，视角和显示属性保持不变）
         self.create_hand_model(angles, pressures)
-        
-        # 更新画布
-        self.canvas.draw()
-
-    def update_hand_model_parts(self, angles, pressures):
-        """更新手部模型的各个部分"""
-        # 假设你已经在 create_hand_model 中创建了手部模型的各个部分
-        # 这里我们只更新手指和手掌的绘制数据
-
-        # 更新手掌
-        self.palm.set_data(self.palm_points[:, 0], self.palm_points[:, 1])  # 更新手掌的X和Y数据
-        self.palm.set_3d_properties(self.palm_points[:, 2])  # 更新手掌的Z数据
-
-        # 更新手指
-        for i, finger_key in enumerate(self.finger_colors.keys()):
-            finger_angles = angles[finger_key]
-            finger_color = self.finger_colors[finger_key]
-
-            # 更新手指的绘制数据
-            # 这里假设你有一个手指的线条对象 self.fingers[i]
-            self.fingers[i].set_data(self.finger_points[i][:, 0], self.finger_points[i][:, 1])
-            self.fingers[i].set_3d_properties(self.finger_points[i][:, 2])
-
-            # 更新手指的颜色
-            pressure = pressures[i + 1] / 1024.0  # 确保使用正确的索引
-            color = self.calculate_finger_color(finger_color, pressure)
-            self.fingers[i].set_color(color)
 
     def serial_read_thread(self):
         """串口数据读取线程"""
-        print("\n=== 串口读取线程启动 ===")
-        buffer = ""
+        logging.info("串口读取线程启动")
+        self._leftover = {'angle': b'', 'pressure': b''}
+        self._cache_serial_fds()
+        
+        # 循环中每次都要用到的属性预先取到局部变量，省去重复的属性查找；
+        # 串口对象在线程运行期间不会被替换（重新连接时会先停止线程）
+        stop = self._stop.is_set
+        append = self.data_queue.append
+        notify = self._data_event.set  # 只设置标志，串口线程不调用任何 Tk 接口
+        read_ports = self._read_serial_ports
+        parsers = {
+            'angle': self.parse_serial_data,
+            'pressure': self.parse_pressure_data
+        }
+        ports = [(kind, port) for kind, port in (('angle', self.angle_serial),
+                                                 ('pressure', self.pressure_serial)) if port]
         
-        while self.thread_running:
+        while not stop():
             try:
-                if self.angle_serial and self.angle_serial.is_open:
-                    if self.angle_serial.in_waiting:
-                        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                        # print(f"\n[{timestamp}] ===== 角度传感器数据 =====")
-                        data = self.angle_serial.readline().decode('utf-8').strip()
-                        # print(f"► 原始字节: {data}")
-                        try:
-                            decoded = data.strip()
-                            # print(f"► 解码数据: {decoded}")
-                            if decoded:
-                                success = self.parse_serial_data(decoded)
-                                # print(f"► 数据解析{'成功' if success else '失败'}")
-                                if success:
-                                    self.data_queue.put(True)
-                        except Exception as e:
-                            print(f"[错误] 角度传感器数据解码失败: {e}")
-                            continue
-                
-                if self.pressure_serial and self.pressure_serial.is_open:
-                    if self.pressure_serial.in_waiting:
-                        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                        # print(f"\n[{timestamp}] ===== 压力传感器数据 =====")
-                        data = self.pressure_serial.readline().decode('utf-8').strip()
-                        # 修改解析方式以匹配新格式
-                        if data.startswith('ch0:'):
-                            # print(f"原始数据: {data}")  # 调试输出
-                            try:
-                                # 直接用空格分割
-                                parts = data.split()
-                                print(f"分割后: {parts}")  # 调试输出
-                                
-                                values = []
-                                for part in parts:
-                                    # 只取":"后面的数值部分
-                                    value = int(part.split(':')[1])
-                                    values.append(value)
-                                
-                                if len(values) == 5:
-                                    # print(f"解析出的压力值: {values}")  # 调试输出
-                                    self.pressure_data = values.copy()
-                                    self.data_queue.put(('pressure', values))
-                                # else:
-                                    # print(f"压力数据长度不正确: {len(values)}")
-                            except Exception as e:
-                                print(f"压力数据解析错误: {e}")
-                
-                time.sleep(0.001)  # 短暂休眠，避免CPU占用过高
+                # 角度和压力数据都是纯ASCII，直接解析原始字节，无需解码；
+                # 一次读到多行时界面只需要最新一帧，从后往前只解析到第一个有效行
+                for kind, lines in read_ports(ports):
+                    parse = parsers[kind]
+                    for data in reversed(lines):
+                        value = parse(data.strip())
+                        if value is not None:
+                            append((kind, value))
+                            notify()
+                            break
                     
             except Exception as e:
-                print(f"串口读取错误: {e}")
-                buffer = ""  # 出错时清空缓冲区
-                # 等待1秒后重试
-                print("等待1秒后重试连接...")
-                time.sleep(1)
+                logging.error(f"串口读取错误: {e}")
+                self._leftover = {'angle': b'', 'pressure': b''}  # 出错时清空缓冲区
+                # 等待1秒后重试（期间收到停止通知会立即退出）
+                logging.info("等待1秒后重试连接...")
+                if self._stop.wait(1):
+                    break
                 
                 # 尝试重新打开串口
                 try:
@@ -476,24 +465,100 @@ class DataGloveVisualizer:
                         if self.angle_serial.is_open:
                             self.angle_serial.close()
                         self.angle_serial.open()
-                        print("角度传感器串口重新连接成功")
+                        logging.info("角度传感器串口重新连接成功")
                         
                     if self.pressure_serial:
                         if self.pressure_serial.is_open:
                             self.pressure_serial.close()
                         self.pressure_serial.open()
-                        print("压力传感器串口重新连接成功")
+                        logging.info("压力传感器串口重新连接成功")
+                    
+                    self._cache_serial_fds()  # 重新打开后文件描述符会变化
                         
                 except Exception as retry_error:
-                    print(f"重新连接失败: {retry_error}")
+                    logging.error(f"重新连接失败: {retry_error}")
                     break
         
-        print("=== 串口读取线程结束 ===\n")
+        logging.info("串口读取线程结束")
 
+    def _cache_serial_fds(self):
+        """记录已打开串口的文件描述符，供 _read_serial_ports 直接 select/os.read"""
+        self._fds = {
+            'angle': self._serial_fd(self.angle_serial),
+            'pressure': self._serial_fd(self.pressure_serial)
+        }
+
+    @staticmethod
+    def _serial_fd(port):
+        """POSIX 下返回串口的文件描述符；Windows 下或串口未打开时返回 None"""
+        if sys.platform == 'win32' or not (port and port.is_open):
+            return None
+        try:
+            return port.fileno()
+        except (AttributeError, serial.SerialException):
+            return None
+
+    def _read_serial_ports(self, ports):
+        """读取所有已打开串口中的完整行，返回 [(数据类型, 行列表), ...]
+        
+        POSIX 下用一次 select 同时等待所有串口（超时与串口一致），只从可读的串口 os.read，
+        一次取出缓冲区中的全部数据，绕开 pyserial 在 Python 层的读取循环，等待和读取期间都不占用 GIL；
+        某个串口空闲时不会拖慢另一个串口的数据。
+        没有文件描述符的串口（Windows）逐个用 _read_serial_lines 读取。
+        """
+        results = []
+        fd_kinds = {}  # 文件描述符 -> 数据类型
+        timeout = 0
+        for kind, port in ports:
+            if not port.is_open:
+                continue
+            fd = self._fds.get(kind)
+            if fd is None:
+                results.append((kind, self._read_serial_lines(port, kind)))
+            else:
+                fd_kinds[fd] = kind
+                timeout = port.timeout
+        
+        if fd_kinds:
+            # 前面已经有串口阻塞等待过时，这里只检查不再等待
+            ready = select.select(list(fd_kinds), [], [], 0 if results else timeout)[0]
+            for fd in ready:
+                kind = fd_kinds[fd]
+                try:
+                    data = os.read(fd, self._READ_SIZE)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    # 设备断开时 select 会一直报告可读但读不到数据，交给重连逻辑处理
+                    raise serial.SerialException("串口可读但没有数据（设备可能已断开）")
+                results.append((kind, self._split_lines(kind, data)))
+        return results
+
+    def _read_serial_lines(self, port, kind):
+        """通过 pyserial 读取串口中所有完整的行（Windows 下使用）
+        
+        缓冲区中已有数据时一次 read 全部取出，减少系统调用；
+        没有数据时用 read_until 在串口超时时间内阻塞等待，超时或读满 _MAX_LINE 即返回，
+        设备停止发送时线程仍能及时响应停止通知。
+        """
+        waiting = port.in_waiting
+        if waiting:
+            data = port.read(waiting)
+        else:
+            data = port.read_until(b'\n', self._MAX_LINE)
+        return self._split_lines(kind, data)
+
+    def _split_lines(self, kind, data):
+        """与上次剩下的不完整数据拼接后按行分割，不完整的部分留到下次拼接"""
+        lines = (self._leftover[kind] + data).split(b'\n')
+        leftover = lines.pop()
+        # 超长且没有换行的数据视为无效，直接丢弃
+        self._leftover[kind] = leftover if len(leftover) < self._MAX_LINE else b''
+        return lines
 
     def stop_serial_thread(self):
         """停止串口数据读取线程"""
-        self.thread_running = False
+        self._stop.set()
         if self.serial_thread:
             self.serial_thread.join(timeout=1.0)
 
@@ -522,13 +587,13 @@ class DataGloveVisualizer:
                 if angle_port:
                     self.angle_serial = serial.Serial(port=angle_port,
                                                       baudrate=115200,
-                                                      timeout=0.03)
+                                                      timeout=0.02)
                     logging.info(f"角度数据串口{angle_port}已连接")
                 
                 if pressure_port:
                     self.pressure_serial = serial.Serial(port=pressure_port,
                                                         baudrate=115200,
-                                                        timeout=0.03)
+                                                        timeout=0.02)
                     logging.info(f"压力数据串口{pressure_port}已连接")
                 
                 self.connect_btn.configure(text="断开")
@@ -544,37 +609,16 @@ class DataGloveVisualizer:
     
     def start_serial_thread(self):
         """启动串口数据读取线程"""
-        self.thread_running = True
+        self._stop.clear()
         self.serial_thread = threading.Thread(target=self.serial_read_thread)
         self.serial_thread.daemon = True  # 设置为守护线程，这样主程序退出时线程会自动结束
         self.serial_thread.start()
         logging.info("串口数据读取线程已启动")
-
-    # def update(self):
-    #     """更新函数"""
-    #     if not self.updating:
-    #         try:
-    #             self.updating = True
-                
-    #             # 检查数据队列
-    #             while not self.data_queue.empty():
-    #                 try:
-    #                     # 取出数据但不使用，因为实际数据已经在parse_serial_data中更新
-    #                     self.data_queue.get_nowait()
-    #                 except queue.Empty:
-    #                     break
-                
-    #             # 更新显示
-    #             self.update_data_display()
-    #             self.update_hand_model()
-                
-    #         except Exception as e:
-    #             logging.error(f"更新时发生错误: {e}")
-    #         finally:
-    #             self.updating = False
-                
-    #     # 安排下一次更新
-    #     self.root.after(self.update_interval, self.update)
+        
+        # 串口线程运行期间才需要检查新数据标志，重新连接时先取消上一轮的定时器
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+        self._poll_job = self.root.after(self.update_interval, self._poll_sensor_data)
 
     # def start_visualization_thread(self):
     #     """启动可视化更新线程"""
@@ -594,21 +638,19 @@ class DataGloveVisualizer:
         """更新数据显示"""
         try:
             # 更新压力数据显示
-            if hasattr(self, 'pressure_data') and isinstance(self.pressure_data, list):
-                for i, (var, label) in enumerate(zip(self.pressure_vars, self.pressure_labels)):
-                    if i < len(self.pressure_data):
-                        value = self.pressure_data[i]
-                        var.set(value)
-                        label.config(text=str(value))
+            for i, (bar, label, value) in enumerate(zip(self.pressure_bars, self.pressure_labels,
+                                                        self.pressure_data.tolist())):
+                # 数值未变化时跳过，减少控件刷新
+                if self._last_pressure[i] == value:
+                    continue
+                self._last_pressure[i] = value
+                bar['value'] = value
+                label.config(text=str(value))
         
             # 更新角度数据显示
-            if hasattr(self, 'angle_data') and isinstance(self.angle_data, dict):
-                for finger_id, labels in self.angle_labels.items():
-                    if finger_id in self.angle_data:
-                        angles = self.angle_data[finger_id]
-                        for i, label in enumerate(labels):
-                            if i < len(angles):
-                                label.config(text=f"{angles[i]:.1f}°")
+            for i, labels in enumerate(self.angle_labels.values()):
+                for j, label in enumerate(labels):
+                    label.config(text=f"{self.angle_data[i, j]:.1f}°")
         except Exception as e:
             logging.error(f"更新数据显示时出错: {e}")
 
@@ -628,9 +670,10 @@ class DataGloveVisualizer:
         pressure_frame = ttk.LabelFrame(left_frame, text="压力数据")
         pressure_frame.pack(fill=tk.BOTH, padx=5, pady=5, expand=True)
         
-        # 为每个手指创建滑动条和标签
-        self.pressure_vars = []
+        # 为每个手指创建进度条和标签
+        self.pressure_bars = []
         self.pressure_labels = []
+        self._last_pressure = [0] * 5
         finger_names = ["大拇指", "食指", "中指", "无名指", "小指"]
         
         for i, name in enumerate(finger_names):
@@ -641,14 +684,11 @@ class DataGloveVisualizer:
             # 添加手指名称标签
             ttk.Label(row_frame, text=f"{name}:", width=8).pack(side=tk.LEFT)
             
-            # 创建压力值变量和标签
-            pressure_var = tk.IntVar(value=0)
-            self.pressure_vars.append(pressure_var)
-            
-            # 创建滑动条
-            scale = ttk.Scale(row_frame, from_=0, to=1024, orient=tk.HORIZONTAL,
-                            variable=pressure_var, state='readonly')
-            scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+            # 创建进度条（只读显示，比滑动条更新开销小）
+            bar = ttk.Progressbar(row_frame, orient=tk.HORIZONTAL, maximum=1024,
+                                  mode='determinate')
+            bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+            self.pressure_bars.append(bar)
             
             # 创建数值标签
             value_label = ttk.Label(row_frame, text="0", width=6)
@@ -768,6 +808,11 @@ class DataGloveVisualizer:
         fps_combo.pack(side=tk.LEFT, padx=2)
         fps_combo.bind("<<ComboboxSelected>>", self.update_frequency)
         
+        # 坐标轴显示开关（调试用）
+        self.show_axes_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="显示坐标轴", variable=self.show_axes_var,
+                        command=self.toggle_axes).pack(side=tk.LEFT, padx=5)
+        
         # 初始化时刷新串口列表
         self.refresh_ports()
         
@@ -785,6 +830,14 @@ class DataGloveVisualizer:
                 self.fps_var.set("60")
                 self.root.after(100, self.release_update_lock)
 
+    def toggle_axes(self):
+        """切换坐标轴显示"""
+        if self.show_axes_var.get():
+            self.ax.set_axis_on()
+        else:
+            self.ax.set_axis_off()
+        self.canvas.draw_idle()
+
     def release_update_lock(self):
         """释放更新锁定"""
         self.update_locked = False
@@ -794,7 +847,7 @@ class DataGloveVisualizer:
         if not self.angle_serial or not self.angle_serial.is_open:
             messagebox.showwarning("警告", "请先连接串口")
             return
-        self.calibration_min = self.current_raw_angles if hasattr(self, 'current_raw_angles') else [float('inf')] * 14
+        self.calibration_min = self.current_raw_angles.copy() if hasattr(self, 'current_raw_angles') else np.full(14, np.inf, dtype=np.float32)
         logging.info("已设置最小值校准点")
         messagebox.showinfo("成功", "已设置最小值校准点")
 
@@ -803,123 +856,188 @@ class DataGloveVisualizer:
         if not self.angle_serial or not self.angle_serial.is_open:
             messagebox.showwarning("警告", "请先连接串口")
             return
-        self.calibration_max = self.current_raw_angles if hasattr(self, 'current_raw_angles') else [float('-inf')] * 14
+        self.calibration_max = self.current_raw_angles.copy() if hasattr(self, 'current_raw_angles') else np.full(14, -np.inf, dtype=np.float32)
         self.is_calibrated = True
         logging.info("已设置最大值校准点")
         messagebox.showinfo("成功", "已设置最大值校准点")
 
     def reset_calibration(self):
         """重置校准数据"""
-        self.calibration_min = [float('inf')] * 14
-        self.calibration_max = [float('-inf')] * 14
+        self.calibration_min = np.full(14, np.inf, dtype=np.float32)
+        self.calibration_max = np.full(14, -np.inf, dtype=np.float32)
         self.is_calibrated = False
         logging.info("已重置校准数据")
         messagebox.showinfo("成功", "已重置校准数据")
 
-    def map_angle(self, value, idx):
-        """将原始角度映射到0-90度范围"""
+    def map_angles(self, values):
+        """将14路原始角度批量映射到0-90度范围"""
         if not self.is_calibrated:
-            # logging.debug(f"未校准，返回原始值: idx={idx}, value={value}")
-            return value
-        
-        min_val = self.calibration_min[idx]
-        max_val = self.calibration_max[idx]
+            return values
         
-        if min_val == float('inf') or max_val == float('-inf'):
-            logging.debug(f"校准值无效: idx={idx}, min={min_val}, max={max_val}")
-            return value
+        # 未设置校准点的通道跨度为无穷，保持原始值
+        span = self.calibration_max - self.calibration_min
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mapped = np.clip((values - self.calibration_min) / span * 90, 0, 90)
         
-        # 确保不会出现除以零的情况
-        if max_val == min_val:
-            logging.debug(f"最大最小值相等: idx={idx}, value={max_val}")
-            return 45  # 返回中间值
-        
-        mapped = (value - min_val) / (max_val - min_val) * 90
-        mapped = max(0, min(90, mapped))
-        logging.debug(f"角度映射: idx={idx}, raw={value}, min={min_val}, max={max_val}, mapped={mapped}")
-        return mapped
+        # 确保不会出现除以零的情况：最大最小值相等时返回中间值
+        mapped = np.where(span == 0, 45, mapped)
+        return np.where(np.isfinite(span), mapped, values)
 
     def parse_serial_data(self, data):
-        """解析串口数据"""
+        """解析串口数据（原始字节），返回14路原始角度
+        
+        在串口线程中调用，只做解析，不修改任何界面状态。
+        """
         try:
-            # 解析形如 C1=115.412,C2=34.382,...
-            parts = data.strip().split(',')
-            if len(parts) != 14:
+            # 解析形如 C1=115.412,C2=34.382,...，不完整的数据包匹配不到14个值
+            values = self._PACKET_RE.findall(data)
+            if len(values) != 14:
                 return None
-                
-            angles = []
-            for part in parts:
-                try:
-                    value = float(part.split('=')[1])
-                    angles.append(value)
-                except (ValueError, IndexError):
-                    return None
-                    
-            self.current_raw_angles = angles
-            
-            # 映射角度到0-90度范围
-            mapped_angles = [self.map_angle(angle, i) for i, angle in enumerate(angles)]
-            
-            # 将映射后的角度分配给指关节
-            self.angle_data["finger_1"] = [mapped_angles[3], mapped_angles[2], mapped_angles[5]]   # 食指 (C4,C3,C6)
-            self.angle_data["finger_2"] = [mapped_angles[6], mapped_angles[9], mapped_angles[4]]   # 中指 (C7,C10,C5)
-            self.angle_data["finger_3"] = [mapped_angles[13], mapped_angles[8], mapped_angles[7]]   # 无名指 (C14,C9,C8)
-            self.angle_data["finger_4"] = [mapped_angles[12], mapped_angles[11], mapped_angles[10]]   # 小指 (C13,C12,C11)
-            self.angle_data["finger_0"] = [mapped_angles[0], mapped_angles[0]]   # 大拇指 (C2,C1)
-            # self.angle_data["finger_1"] = mapped_angles[0:3]   # 食指 (C1-C3)
-            # self.angle_data["finger_2"] = mapped_angles[3:6]   # 中指 (C4-C6)
-            # self.angle_data["finger_3"] = mapped_angles[6:9]   # 无名指 (C7-C9)
-            # self.angle_data["finger_4"] = mapped_angles[9:12]  # 小指 (C10-C12)
-            # self.angle_data["finger_0"] = mapped_angles[12:14] # 大拇指 (C13-C14)
             
-            # logging.info(f"原始角度数据: {angles}")
-            # logging.info(f"映射后角度数据: {mapped_angles}")
-            # logging.info(f"更新后的手指角度: {self.angle_data}")
-            
-            return True
+            return np.asarray(values, dtype=np.float32)
         except Exception as e:
             logging.error(f"数据解析错误: {e}")
             return None
 
+    def parse_pressure_data(self, data):
+        """解析压力串口数据（原始字节），返回5路压力值
+        
+        数据格式形如 ch0:123 ch1:456 ...，在串口线程中调用，不修改任何界面状态。
+        """
+        if not data.startswith(b'ch0:'):
+            return None
+        try:
+            # 直接用空格分割
+            parts = data.split()
+            logging.debug("分割后: %s", parts)  # 调试输出，仅在输出时格式化
+            
+            # 只取":"后面的数值部分，int() 可以直接解析字节
+            values = [int(part.split(b':')[1]) for part in parts]
+            if len(values) != 5:
+                return None
+            # 超出int16范围的读数视为无效数据，避免转换时数值回绕
+            if not all(-32768 <= v <= 32767 for v in values):
+                logging.error(f"压力数据超出范围: {data}")
+                return None
+            return np.array(values, dtype=np.int16)
+        except (ValueError, IndexError) as e:
+            logging.error(f"压力数据解析错误: {e}")
+            return None
+
+    def _apply_angles(self, angles):
+        """在界面线程中映射原始角度并更新手指角度数据，返回角度是否发生变化"""
+        self.current_raw_angles = angles
+        
+        # 映射角度到0-90度范围
+        mapped_angles = self.map_angles(angles)
+        
+        # 将映射后的角度分配给指关节，大拇指第三个关节保持 NaN
+        finger_angles = np.take(mapped_angles, self._ANGLE_CHANNELS)
+        finger_angles[0, 2] = np.nan
+        if np.array_equal(finger_angles, self.angle_data, equal_nan=True):
+            return False
+        self.angle_data[:] = finger_angles
+        return True
+
+    def _apply_pressure(self, values):
+        """在界面线程中更新压力数据，返回压力是否发生变化"""
+        if np.array_equal(values, self.pressure_data):
+            return False
+        self.pressure_data[:] = values
+        return True
+
+
+    def _poll_sensor_data(self):
+        """按刷新频率检查串口线程设置的新数据标志，有新数据时安排一次更新
+        
+        串口线程只设置 threading.Event，不调用 Tk：工作线程调用 Tk 时会等待主循环处理，
+        在停止线程（主线程 join 等待）或主循环退出时会互相等待。
+        串口线程停止后处理完最后的数据就不再继续定时，未连接时没有定时唤醒。
+        """
+        self._poll_job = None
+        if self._data_event.is_set():
+            self._data_event.clear()
+            self._request_update()
+        if not self._stop.is_set():
+            self._poll_job = self.root.after(self.update_interval, self._poll_sensor_data)
+
+    def _request_update(self):
+        """安排一次更新，两次更新间隔不小于刷新频率对应的时间"""
+        if self._update_job is not None:
+            return
+        elapsed = time.monotonic() * 1000 - self._last_update_ts
+        delay = max(0, int(self.update_interval - elapsed))
+        self._update_job = self.root.after(delay, self.update_visualization)
 
     def update_visualization(self):
         """统一的更新函数"""
+        self._update_job = None
+        self._last_update_ts = time.monotonic() * 1000
         if not self.updating:
             try:
                 self.updating = True
-                self.visualization_running = True
-                updated = False
+                dirty = False
+                latest = {}
                 
-                # 处理所有队列中的数据
-                while not self.data_queue.empty():
-                    data = self.data_queue.get_nowait()
-                    if isinstance(data, list) and len(data) == 5:  # 压力数据
-                        self.pressure_data = data.copy()  # 使用copy避免引用问题
-                        updated = True
-                    elif data is True:  # 角度数据更新标志
-                        updated = True
+                # 取出队列中的所有数据，每种数据只保留最新的一帧
+                try:
+                    while True:
+                        kind, payload = self.data_queue.popleft()
+                        latest[kind] = payload
+                except IndexError:
+                    pass
+                
+                # 只有数值真正变化时才标记需要重绘
+                for kind, payload in latest.items():
+                    dirty |= self._data_handlers[kind](payload)
                 
-                # 只在有数据更新时进行显示更新
-                if updated:
-                    # 更新显示
-                    self.update_data_display()  # 更新数据面板
-                    self.update_hand_model(     # 更新3D模型
-                        angles=self.angle_data, 
-                        pressures=self.pressure_data
-                    )
+                # 只在有数据更新时安排重绘
+                if dirty:
+                    self._data_display_pending = True
+                    self._schedule_render()
+                else:
+                    # 数据面板可能还有被限速推迟的最后一帧
+                    self._refresh_data_display()
                 
             except Exception as e:
                 logging.error(f"更新可视化时出错: {e}")
             finally:
                 self.updating = False
         
-        if self.visualization_running:
-            self.root.after(self.update_interval, self.update_visualization)
+        # 数据面板被限速推迟时，下一个间隔再检查一次
+        if self._data_display_pending:
+            self._request_update()
+
+    def _schedule_render(self):
+        """在Tk空闲时安排一次重绘，多次请求合并为一次"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self._render)
+
+    def _render(self):
+        """重绘3D模型，并限速刷新数据面板"""
+        self._render_pending = False
+        try:
+            self.update_hand_model(     # 更新3D模型
+                angles=self.angle_data, 
+                pressures=self.pressure_data
+            )
+            self._refresh_data_display()
+        except Exception as e:
+            logging.error(f"重绘时出错: {e}")
+
+    def _refresh_data_display(self):
+        """数据面板限速刷新，最后一帧数据也会在下一个间隔内显示"""
+        now = time.monotonic() * 1000
+        if (self._data_display_pending and
+                now - self._last_data_display_ts >= self._data_display_interval_ms):
+            self.update_data_display()  # 更新数据面板
+            self._last_data_display_ts = now
+            self._data_display_pending = False
 
 
     def run(self):
         """运行应用程序"""
-        self.root.after(self.update_interval, self.update_visualization)
         # self.start_visualization_thread()
         self.root.mainloop()
         